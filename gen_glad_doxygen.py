@@ -26,7 +26,7 @@
 Generate Doxygen docblocks for GLAD alias macros using Khronos DocBook refpages.
 
 USAGE
-  Python:  python gen_glad_doxygen.py --in <path/to/gl.h> --xml <path/to/gl.xml> --refpages <path/to/ref/gl4> --out <path/to/out.hpp>
+  Python:  python gen_glad_doxygen.py --in <path/to/gl.h> --xml <path/to/gl.xml> --refpages <path/to/ref/gl4> --out <path/to/out.hpp> [--jobs N]
   PowerShell:
     py .\gen_glad_doxygen.py `
       --in       "C:\code\glad\include\glad\gl.h" `
@@ -36,126 +36,210 @@ USAGE
 """
 
 from __future__ import annotations
-import argparse, os, re, xml.etree.ElementTree as ET
-from typing import Dict, List, Optional, Tuple, Set
+import argparse, codecs, mmap, os, re, stat, sys, tempfile
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import BinaryIO, Dict, Iterator, List, NamedTuple, Optional, Tuple, Set, Union
+
+# Prefer lxml (libxml2 parsing and traversal in C); fall back to the stdlib ElementTree
+try:
+    from lxml import etree as ET
+    HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAVE_LXML = False
+
+# lxml keeps comments and PIs in the tree (splitting .text around them) unless told otherwise;
+# drop them at parse time, as the stdlib parser does
+_LXML_TREE_OPTS = {"remove_comments": True, "remove_pis": True} if HAVE_LXML else {}
 
 # Collapse runs of whitespace to single spaces
 def norm_ws(s: str) -> str:
     return " ".join(s.split())
 
-# Concatenate all text nodes under an XML element
-def flatten_text(elem: ET.Element) -> str:
-    return "".join(elem.itertext())
-
-# Build a public Khronos refpage URL for a function
-def make_refpage_url(folder_tag: str, func: str) -> str:
-    return f"https://registry.khronos.org/OpenGL-Refpages/{folder_tag}/html/{func}.xhtml"
+# All text under an XML element with whitespace runs collapsed. Text nodes are joined before
+# splitting so words that straddle inline markup (e.g. "point<emphasis>ers</emphasis>") stay intact
+def flatten_norm(elem: ET.Element) -> str:
+    return " ".join("".join(elem.itertext()).split())
+
+# Concatenate text under an XML element, leaving out child elements with the given local tag name
+def flatten_text_without(elem: ET.Element, skip_tag: str) -> str:
+    parts = [elem.text or ""]
+    for child in elem:
+        if child.tag.rpartition("}")[2] != skip_tag:
+            parts.extend(child.itertext())
+        parts.append(child.tail or "")
+    return "".join(parts)
+
+# Base of the public Khronos refpage URLs; a function's page is base + func + ".xhtml"
+def make_refpage_base_url(folder_tag: str) -> str:
+    return f"https://registry.khronos.org/OpenGL-Refpages/{folder_tag}/html/"
+
+class GLParam(NamedTuple):
+    """One gl.xml command parameter: C type, name, and optional group/len metadata."""
+    type: str
+    name: str
+    group: Optional[str]
+    len: Optional[str]
 
 class GLRegistry:
     """Minimal reader for gl.xml: commands, aliases, versions, and extensions."""
 
     def __init__(self, xml_path: str):
-        self.root = ET.parse(xml_path).getroot()
-        self.commands: Dict[str, Dict] = {}             # name -> {"ret": str, "params": list, "alias": str|None}
+        # Command signatures as parallel arrays indexed through _cmd_index
+        self._cmd_index: Dict[str, int] = {}            # name -> row
+        self._cmd_ret: List[str] = []                   # row -> return type
+        self._cmd_params: List[List[GLParam]] = []      # row -> parameters
         self.alias_of: Dict[str, str] = {}              # name -> canonical name
         self.introduced_version: Dict[str, str] = {}    # name -> "major.minor"
         self.extensions_for_cmd: Dict[str, Set[str]] = {}  # name -> {EXT1, EXT2, ...}
-        self._parse_commands()
-        self._parse_features()
-        self._parse_extensions()
-
-    # Fill command signatures and alias links
-    def _parse_commands(self) -> None:
-        for cmd in self.root.findall("./commands/command"):
-            proto = cmd.find("proto")
-            if proto is None:
-                continue
-            name = proto.findtext("name")
-            if not name:
+        self._parse(xml_path)
+
+        # Canonical name for every aliased command, resolved once up front (the alias graph is static)
+        self._resolved: Dict[str, str] = {}
+        for name in self.alias_of:
+            self._resolved[name] = self._walk_alias(name)
+
+        # Version and sorted extensions for every known command, with the canonical alias folded in
+        self._version_exts: Dict[str, Tuple[Optional[str], Tuple[str, ...]]] = {}
+        no_exts: Set[str] = set()
+        for name in set(self._cmd_index) | set(self.introduced_version) | set(self.extensions_for_cmd):
+            canon = self.resolve_alias(name)
+            v = self.introduced_version.get(name)
+            if v is None:
+                v = self.introduced_version.get(canon)
+            exts = self.extensions_for_cmd.get(name, no_exts) | self.extensions_for_cmd.get(canon, no_exts)
+            self._version_exts[name] = (v, tuple(sorted(exts)))
+
+    # Stream gl.xml once, handing each <command>, <feature> and <extension> to its parser
+    # as soon as it closes and clearing finished subtrees to keep memory flat
+    def _parse(self, xml_path: str) -> None:
+        path: List[str] = []                  # tags of the currently open ancestors
+        target: Optional[ET.Element] = None   # open element to parse once it closes
+        for event, elem in ET.iterparse(xml_path, events=("start", "end"), **_LXML_TREE_OPTS):
+            if event == "start":
+                if target is None and self._is_parsed(path, elem.tag):
+                    target = elem
+                path.append(elem.tag)
                 continue
 
-            # Return type: remove the function name token from the proto text
-            proto_text = norm_ws(flatten_text(proto))
-            ret_type = norm_ws(re.sub(r"\b"+re.escape(name)+r"\b", "", proto_text))
-            ret_type = norm_ws(ret_type.replace("APIENTRY", "").replace("GLAPIENTRY", ""))
-
-            # Parameters: capture type/name and optional group/len metadata
-            params: List[Dict[str, Optional[str]]] = []
-            for p in cmd.findall("param"):
-                pname = p.findtext("name")
-                if not pname:
+            path.pop()
+            if target is not None:
+                if elem is not target:
                     continue
-                p_text = norm_ws(flatten_text(p))
-                p_type = norm_ws(re.sub(r"\b"+re.escape(pname)+r"\b", "", p_text))
-                params.append({
-                    "type": p_type,
-                    "name": pname,
-                    "group": p.get("group"),
-                    "len": p.get("len"),
-                })
+                target = None
+                if elem.tag == "command":
+                    self._parse_command(elem)
+                elif elem.tag == "feature":
+                    self._parse_feature(elem)
+                else:
+                    self._parse_extension(elem)
+            elem.clear()
+
+    # True for ./feature, ./commands/command and ./extensions/extension under the root
+    @staticmethod
+    def _is_parsed(path: List[str], tag: str) -> bool:
+        if len(path) == 1:
+            return tag == "feature"
+        if len(path) == 2:
+            return (path[1], tag) in (("commands", "command"), ("extensions", "extension"))
+        return False
+
+    # Fill one command signature and alias link
+    def _parse_command(self, cmd: ET.Element) -> None:
+        proto = cmd.find("proto")
+        if proto is None:
+            return
+        name = proto.findtext("name")
+        if not name:
+            return
+        name = sys.intern(name)
+
+        # Return type: the proto text minus its <name> child
+        ret_type = norm_ws(flatten_text_without(proto, "name"))
+        ret_type = sys.intern(norm_ws(ret_type.replace("APIENTRY", "").replace("GLAPIENTRY", "")))
+
+        # Parameters: capture type/name and optional group/len metadata; types and names
+        # repeat across thousands of commands, so intern them
+        params: List[GLParam] = []
+        for p in cmd.findall("param"):
+            pname = p.findtext("name")
+            if not pname:
+                continue
+            p_type = norm_ws(flatten_text_without(p, "name"))
+            params.append(GLParam(sys.intern(p_type), sys.intern(pname), p.get("group"), p.get("len")))
 
-            alias = cmd.get("alias")
-            if alias:
-                self.alias_of[name] = alias
+        alias = cmd.get("alias")
+        if alias:
+            self.alias_of[name] = alias
 
-            self.commands[name] = {"ret": ret_type, "params": params, "alias": alias}
+        # A repeated definition takes a new row; the index points at the latest one
+        self._cmd_index[name] = len(self._cmd_ret)
+        self._cmd_ret.append(ret_type)
+        self._cmd_params.append(params)
 
     # Record the earliest core GL version introducing each command
-    def _parse_features(self) -> None:
-        for feat in self.root.findall("./feature"):
-            if feat.get("api") != "gl":
-                continue
-            number = feat.get("number") or ""
-            if not number:
-                continue
-            for req in feat.findall("./require"):
-                for c in req.findall("./command"):
-                    nm = c.get("name")
-                    if not nm:
-                        continue
-                    if nm not in self.introduced_version:
-                        self.introduced_version[nm] = number
-                    else:
-                        # Keep the minimum version seen; ignore parse errors
-                        try:
-                            a = tuple(map(int, number.split(".")))
-                            b = tuple(map(int, self.introduced_version[nm].split(".")))
-                            if a < b:
-                                self.introduced_version[nm] = number
-                        except Exception:
-                            pass
-
-    # Map commands to extension names that add them
-    def _parse_extensions(self) -> None:
-        for ext in self.root.findall("./extensions/extension"):
-            ext_name = ext.get("name")
-            if not ext_name:
-                continue
-            for req in ext.findall("./require"):
-                for c in req.findall("./command"):
-                    nm = c.get("name")
-                    if not nm:
-                        continue
-                    self.extensions_for_cmd.setdefault(nm, set()).add(ext_name)
-
-    # Follow alias links to a canonical command name
-    def resolve_alias(self, name: str) -> str:
+    def _parse_feature(self, feat: ET.Element) -> None:
+        if feat.get("api") != "gl":
+            return
+        number = feat.get("number") or ""
+        if not number:
+            return
+        for req in feat.findall("./require"):
+            for c in req.findall("./command"):
+                nm = c.get("name")
+                if not nm:
+                    continue
+                if nm not in self.introduced_version:
+                    self.introduced_version[nm] = number
+                else:
+                    # Keep the minimum version seen; ignore parse errors
+                    try:
+                        a = tuple(map(int, number.split(".")))
+                        b = tuple(map(int, self.introduced_version[nm].split(".")))
+                        if a < b:
+                            self.introduced_version[nm] = number
+                    except Exception:
+                        pass
+
+    # Map commands to the extension that adds them
+    def _parse_extension(self, ext: ET.Element) -> None:
+        ext_name = ext.get("name")
+        if not ext_name:
+            return
+        for req in ext.findall("./require"):
+            for c in req.findall("./command"):
+                nm = c.get("name")
+                if not nm:
+                    continue
+                self.extensions_for_cmd.setdefault(nm, set()).add(ext_name)
+
+    # Follow alias links to a canonical command name, reusing chains resolved earlier
+    def _walk_alias(self, name: str) -> str:
         seen = set()
         cur = name
         while cur in self.alias_of and cur not in seen:
+            done = self._resolved.get(cur)
+            if done is not None and done not in self.alias_of:
+                return done
             seen.add(cur)
             cur = self.alias_of[cur]
         return cur
 
+    # Canonical command name for `name` (itself when it is not an alias)
+    def resolve_alias(self, name: str) -> str:
+        return self._resolved.get(name, name)
+
     # Exact-name signature from gl.xml
-    def signature(self, name: str) -> Optional[Tuple[str, List[Dict[str, Optional[str]]]]]:
-        info = self.commands.get(name)
-        if not info:
+    def signature(self, name: str) -> Optional[Tuple[str, List[GLParam]]]:
+        i = self._cmd_index.get(name)
+        if i is None:
             return None
-        return info["ret"], info["params"]
+        return self._cmd_ret[i], self._cmd_params[i]
 
     # Canonical-name signature (after alias resolution)
-    def signature_canonical(self, name: str) -> Optional[Tuple[str, List[Dict[str, Optional[str]]], str]]:
+    def signature_canonical(self, name: str) -> Optional[Tuple[str, List[GLParam], str]]:
         canon = self.resolve_alias(name)
         sig = self.signature(canon)
         if not sig:
@@ -164,181 +248,336 @@ class GLRegistry:
         return ret, params, canon
 
     # Earliest core version (if any) and extensions introducing the command
-    def version_or_exts(self, name: str) -> Tuple[Optional[str], List[str]]:
-        v = self.introduced_version.get(name)
-        if v is None:
-            v = self.introduced_version.get(self.resolve_alias(name))
-        exts = sorted(self.extensions_for_cmd.get(name, set()) |
-                      self.extensions_for_cmd.get(self.resolve_alias(name), set()))
-        return v, exts
+    def version_or_exts(self, name: str) -> Tuple[Optional[str], Tuple[str, ...]]:
+        return self._version_exts.get(name, (None, ()))
+
+# Cut a <!DOCTYPE ...> declaration, including any internal [...] subset, out of raw XML
+def strip_doctype(data: bytes) -> bytes:
+    start = data.find(b"<!DOCTYPE")
+    if start < 0:
+        return data
+    end = data.find(b">", start)
+    bracket = data.find(b"[", start, end if end >= 0 else len(data))
+    if bracket >= 0:
+        close = data.find(b"]", bracket)
+        end = data.find(b">", close) if close >= 0 else -1
+    if end < 0:
+        return data
+    return data[:start] + data[end + 1:]
+
+# Entity references other than the five predefined XML ones
+_UNKNOWN_ENTITY_RE = re.compile(rb'&(?!lt;|gt;|amp;|quot;|apos;)[A-Za-z][A-Za-z0-9._-]*;')
+
+# Forgiving refpage parser: no DTD loading or network access, recover from undefined entities
+if HAVE_LXML:
+    _REFPAGE_PARSER = ET.XMLParser(recover=True, resolve_entities=False, load_dtd=False, no_network=True,
+                                   **_LXML_TREE_OPTS)
+
+# What build_doc reads from one refpage: brief, C prototype (ret, [(type, name)]), and param descriptions
+RefPageInfo = Tuple[Optional[str], Optional[Tuple[str, List[Tuple[str,str]]]], Dict[str, str]]
 
 class RefPages:
     """Lightweight DocBook reader for brief text, C prototypes, and parameter descriptions."""
     DB_NS = {"db": "http://docbook.org/ns/docbook"}
 
+    # Lookup paths, as (DocBook 5 namespaced, namespace-less) pairs; built once and reused for every refpage,
+    # and under lxml compiled into one union XPath each
+    P_REFPURPOSE = (".//db:refpurpose", ".//refpurpose")
+    P_FUNCPROTOTYPE = (".//db:funcprototype", ".//funcprototype")
+    P_FUNCDEF = ("db:funcdef", "funcdef")
+    P_FUNCTION = ("db:function", "function")
+    P_PARAMDEF = ("db:paramdef", "paramdef")
+    P_PARAMETER = ("db:parameter", "parameter")
+    P_REFSECT1 = (".//db:refsect1", ".//refsect1")
+    P_TITLE = ("db:title", "title")
+    P_VARIABLELIST = (".//db:variablelist", ".//variablelist")
+    P_VARLISTENTRY = ("./db:varlistentry", "./varlistentry")
+    P_TERM = ("./db:term", "./term")
+    P_LISTITEM = ("./db:listitem", "./listitem")
+
     def __init__(self, folder: Optional[str]):
         self.folder = os.path.abspath(folder) if folder else None
         self.folder_tag = os.path.basename(self.folder) if self.folder else "gl4"
-        self.cache: Dict[str, ET.Element] = {}  # func -> parsed XML root
+        self.cache: Dict[str, RefPageInfo] = {}  # func -> (brief, c_signature, param_descriptions)
+        self._available: Set[str] = set()        # funcs with a "<func>.xml" refpage, from one listdir
+        if self.folder:
+            try:
+                self._available = {fn[:-4] for fn in os.listdir(self.folder) if fn.endswith(".xml")}
+            except OSError:
+                pass
+
+    # Compiled XPaths for a path pair (lxml only), built on first use and shared by every instance:
+    # the union of both spellings for _findall, and the first hit of each spelling for _find/_findtext
+    _XPATHS: Dict[Tuple[str, str], Tuple[ET.XPath, ET.XPath, ET.XPath]] = {}
+
+    def _xpaths(self, paths: Tuple[str, str]) -> Tuple[ET.XPath, ET.XPath, ET.XPath]:
+        xps = self._XPATHS.get(paths)
+        if xps is None:
+            ns_path, plain_path = paths
+            xps = self._XPATHS[paths] = (
+                ET.XPath(ns_path + "|" + plain_path, namespaces=self.DB_NS),
+                ET.XPath("(" + ns_path + ")[1]", namespaces=self.DB_NS),
+                ET.XPath("(" + plain_path + ")[1]"),
+            )
+        return xps
+
+    # All matches for a path pair: namespaced hits first, then namespace-less (with either backend;
+    # under lxml one union traversal, then the hits are put in that order)
+    def _findall(self, elem: ET.Element, paths: Tuple[str, str]) -> List[ET.Element]:
+        if HAVE_LXML:
+            hits = self._xpaths(paths)[0](elem)
+            return ([h for h in hits if h.tag.startswith("{")] +
+                    [h for h in hits if not h.tag.startswith("{")])
+        ns_path, plain_path = paths
+        return list(elem.iterfind(ns_path, self.DB_NS)) + list(elem.iterfind(plain_path))
+
+    # First match for a path pair, preferring the namespaced spelling (with either backend)
+    def _find(self, elem: ET.Element, paths: Tuple[str, str]) -> Optional[ET.Element]:
+        if HAVE_LXML:
+            _, ns_first, plain_first = self._xpaths(paths)
+            hits = ns_first(elem) or plain_first(elem)
+            return hits[0] if hits else None
+        ns_path, plain_path = paths
+        found = elem.find(ns_path, self.DB_NS)
+        return found if found is not None else elem.find(plain_path)
+
+    # Text of the first namespaced match, or if that is missing/empty, of the first
+    # namespace-less match (with either backend)
+    def _findtext(self, elem: ET.Element, paths: Tuple[str, str]) -> Optional[str]:
+        if HAVE_LXML:
+            _, ns_first, plain_first = self._xpaths(paths)
+            hits = ns_first(elem)
+            txt = hits[0].text if hits else None
+            if not txt:
+                hits = plain_first(elem)
+                txt = hits[0].text if hits else None
+            return txt
+        ns_path, plain_path = paths
+        return elem.findtext(ns_path, namespaces=self.DB_NS) or elem.findtext(plain_path)
 
     # Path to "<func>.xml" if present
     def _path(self, func: str) -> Optional[str]:
-        if not self.folder:
+        if func not in self._available:
             return None
-        p = os.path.join(self.folder, f"{func}.xml")
-        return p if os.path.isfile(p) else None
+        return os.path.join(self.folder, f"{func}.xml")
 
-    # Parse XML; if strict parse fails, strip DOCTYPE/unknown entities and retry
+    # Parse XML with the DOCTYPE removed; if that fails, strip unknown entities and retry
     def _parse_lenient(self, path: str) -> Optional[ET.Element]:
-        try:
-            return ET.parse(path).getroot()
-        except ET.ParseError:
+        if HAVE_LXML:
+            # libxml2 recovers from the DTD reference and unknown entities on its own
             try:
-                with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                    s = f.read()
-                s = re.sub(r'<!DOCTYPE[^>]*?(\[[\s\S]*?\])?\s*>', '', s, flags=re.IGNORECASE)
-                s = re.sub(r'&(?!lt;|gt;|amp;|quot;|apos;)[A-Za-z][A-Za-z0-9._-]*;', '', s)
-                return ET.fromstring(s)
+                root = ET.parse(path, _REFPAGE_PARSER).getroot()
             except Exception:
                 return None
+            if root is not None:
+                ET.strip_elements(root, ET.Entity, with_tail=False)
+            return root
+        try:
+            with open(path, "rb") as f:
+                data = strip_doctype(f.read())
+            try:
+                return ET.fromstring(data)
+            except ET.ParseError:
+                return ET.fromstring(_UNKNOWN_ENTITY_RE.sub(b"", data))
         except Exception:
             return None
 
-    # Load and cache the refpage XML root
-    def load(self, func: str) -> Optional[ET.Element]:
-        if func in self.cache:
-            return self.cache[func]
+    # Parse the refpage for `func` once, extract everything build_doc needs, and cache only that
+    def _ensure(self, func: str) -> RefPageInfo:
+        info = self.cache.get(func)
+        if info is not None:
+            return info
         path = self._path(func)
-        if path is None:
-            return None
-        root = self._parse_lenient(path)
-        if root is not None:
-            self.cache[func] = root
-        return root
+        root = self._parse_lenient(path) if path is not None else None
+        if root is None:
+            info = (None, None, {})
+        else:
+            info = (self._extract_brief(root), self._extract_signature(root, func),
+                    self._extract_param_descriptions(root))
+        self.cache[func] = info
+        return info
+
+    # Below this many refpages, starting worker processes costs more than parsing in-process
+    PREFETCH_MIN_FUNCS = 64
+
+    # Parse the refpages for `funcs` in worker processes and seed the cache with the results
+    def prefetch(self, funcs: List[str], jobs: Optional[int] = None) -> None:
+        # Only used to decide whether a pool is worth it; with jobs=None the executor picks (and on
+        # Windows caps) the worker count itself
+        workers = jobs if jobs is not None else (os.cpu_count() or 1)
+        if not self.folder or workers <= 1:
+            return
+        todo = sorted({f for f in funcs if f not in self.cache and self._path(f)})
+        if len(todo) < self.PREFETCH_MIN_FUNCS:
+            return
+        try:
+            if sys.platform == "win32" and jobs is not None:
+                jobs = min(jobs, 61)  # ProcessPoolExecutor rejects more workers than this on Windows
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_refpage_worker,
+                                     initargs=(self.folder,)) as pool:
+                for func, info in pool.map(_extract_refpage, todo, chunksize=64):
+                    self.cache[func] = info
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            # No usable process pool here (e.g. no working named semaphores); anything
+            # not fetched is parsed lazily instead
+            pass
 
     # Short one-line description
     def brief(self, func: str) -> Optional[str]:
-        root = self.load(func)
-        if root is None:
-            return None
-        txt = root.findtext(".//db:refpurpose", namespaces=self.DB_NS)
-        if not txt:
-            txt = root.findtext(".//refpurpose")
-        return norm_ws(txt) if txt else None
+        return self._ensure(func)[0]
 
-    # Extract C prototype: return type and list of (type, name)
+    # C prototype: return type and list of (type, name)
     def c_signature(self, func: str) -> Optional[Tuple[str, List[Tuple[str,str]]]]:
-        root = self.load(func)
-        if root is None:
-            return None
-        protos = root.findall(".//db:funcprototype", self.DB_NS) + root.findall(".//funcprototype")
-        for proto in protos:
-            fdef = proto.find("db:funcdef", self.DB_NS)
-            if fdef is None:
-                fdef = proto.find("funcdef")
+        return self._ensure(func)[1]
+
+    # Map parameter name -> description text from the "Parameters" section
+    def param_descriptions(self, func: str) -> Dict[str, str]:
+        return self._ensure(func)[2]
+
+    # <refpurpose> text, whitespace-normalized
+    def _extract_brief(self, root: ET.Element) -> Optional[str]:
+        txt = self._findtext(root, self.P_REFPURPOSE)
+        return norm_ws(txt) if txt else None
+
+    # Pick the funcprototype whose funcdef names `func` (a refpage may cover several commands)
+    def _extract_signature(self, root: ET.Element, func: str) -> Optional[Tuple[str, List[Tuple[str,str]]]]:
+        for proto in self._findall(root, self.P_FUNCPROTOTYPE):
+            fdef = self._find(proto, self.P_FUNCDEF)
             if fdef is None:
                 continue
-            fname = (fdef.findtext("db:function", namespaces=self.DB_NS) or fdef.findtext("function") or "").strip()
+            fname = (self._findtext(fdef, self.P_FUNCTION) or "").strip()
             if fname != func:
                 continue
-            proto_text = norm_ws(flatten_text(fdef))
-            ret = norm_ws(re.sub(r"\b"+re.escape(fname)+r"\b", "", proto_text))
+            ret = norm_ws(flatten_text_without(fdef, "function"))
             params: List[Tuple[str,str]] = []
-            for p in (proto.findall("db:paramdef", self.DB_NS) + proto.findall("paramdef")):
-                pname = (p.findtext("db:parameter", namespaces=self.DB_NS) or p.findtext("parameter") or "").strip()
+            for p in self._findall(proto, self.P_PARAMDEF):
+                pname = (self._findtext(p, self.P_PARAMETER) or "").strip()
                 if not pname:
                     continue
-                p_text = norm_ws(flatten_text(p))
-                p_type = norm_ws(re.sub(r"\b"+re.escape(pname)+r"\b", "", p_text))
+                p_type = norm_ws(flatten_text_without(p, "parameter"))
                 params.append((p_type, pname))
             return ret, params
         return None
 
-    # Map parameter name -> description text from the "Parameters" section
-    def param_descriptions(self, func: str) -> Dict[str, str]:
-        root = self.load(func)
+    # Descriptions from the varlistentries of the "Parameters" refsect1
+    def _extract_param_descriptions(self, root: ET.Element) -> Dict[str, str]:
         out: Dict[str, str] = {}
-        if root is None:
-            return out
-
         sect = None
-        for node in root.findall(".//db:refsect1", self.DB_NS) + root.findall(".//refsect1"):
-            title = (node.findtext("db:title", namespaces=self.DB_NS) or node.findtext("title") or "").strip().lower()
+        for node in self._findall(root, self.P_REFSECT1):
+            title = (self._findtext(node, self.P_TITLE) or "").strip().lower()
             if node.get("{http://www.w3.org/XML/1998/namespace}id") in ("parameters",) or title == "parameters":
                 sect = node
                 break
         if sect is None:
             return out
 
-        vlists = sect.findall(".//db:variablelist", self.DB_NS) + sect.findall(".//variablelist")
-        for v in vlists:
-            entries = v.findall("./db:varlistentry", self.DB_NS) + v.findall("./varlistentry")
-            for e in entries:
+        for v in self._findall(sect, self.P_VARIABLELIST):
+            for e in self._findall(v, self.P_VARLISTENTRY):
                 terms = []
-                for t in e.findall("./db:term", self.DB_NS) + e.findall("./term"):
-                    pname = t.findtext("db:parameter", namespaces=self.DB_NS) or t.findtext("parameter")
+                for t in self._findall(e, self.P_TERM):
+                    pname = self._findtext(t, self.P_PARAMETER)
                     if pname:
                         terms.append(pname.strip())
                 if not terms:
                     continue
-                li = e.find("./db:listitem", self.DB_NS)
-                if li is None:
-                    li = e.find("./listitem")
-                desc = norm_ws(flatten_text(li)) if li is not None else ""
+                li = self._find(e, self.P_LISTITEM)
+                desc = flatten_norm(li) if li is not None else ""
                 for nm in terms:
                     if desc:
                         out[nm] = desc
         return out
 
+# Per-worker RefPages used by prefetch(); set up once per process by the pool initializer
+_WORKER_REFS: Optional[RefPages] = None
+
+def _init_refpage_worker(folder: str) -> None:
+    global _WORKER_REFS
+    _WORKER_REFS = RefPages(folder)
+
+# Extract the refpage info for one function as picklable values
+def _extract_refpage(func: str) -> Tuple[str, RefPageInfo]:
+    refs = _WORKER_REFS
+    assert refs is not None
+    return func, refs._ensure(func)
+
+# Docblock line templates, %-formatted once per line of every generated block
+_FMT_BRIEF = " * \\brief %s"
+_FMT_PARAM_DESC = " * \\param %s (%s) - %s%s"
+_FMT_PARAM_NODESC = " * \\param %s (%s)%s"
+_FMT_RETURN = " * \\return (%s)"
+_FMT_SEE = " * \\see %s%s.xhtml"
+_FMT_NOTE = " * \\note %s"
+_FMT_NOTE_VERSION = "Introduced in OpenGL %s"
+_FMT_NOTE_EXTS = "Introduced by extension(s): %s"
+
 # Build one \param line, including optional metadata trailer
 def make_param_line_with_desc(pname: str, ptype: str, desc: Optional[str], trailer: str = "") -> str:
     if desc:
-        return f" * \\param {pname} ({ptype}) - {desc}{trailer}"
-    return f" * \\param {pname} ({ptype}){trailer}"
+        return _FMT_PARAM_DESC % (pname, ptype, desc, trailer)
+    return _FMT_PARAM_NODESC % (pname, ptype, trailer)
 
 # Append compact hints (group/len) from gl.xml if available
-def make_param_trailer_from_reg(reg_p: Optional[Dict[str, Optional[str]]]) -> str:
+def make_param_trailer_from_reg(reg_p: Optional[GLParam]) -> str:
     if not reg_p:
         return ""
     extras: List[str] = []
-    if reg_p.get("group"):
-        extras.append(f"group: {reg_p['group']}")
-    if reg_p.get("len"):
-        extras.append(f"len: {reg_p['len']}")
+    if reg_p.group:
+        extras.append("group: " + reg_p.group)
+    if reg_p.len:
+        extras.append("len: " + reg_p.len)
     return ("  [" + " | ".join(extras) + "]") if extras else ""
 
-# Match lines of the form: "#define glFoo glad_glFoo"
-DEFINE_RE = re.compile(r'^\s*#\s*define\s+(gl[A-Za-z0-9_]+)\s+(glad_gl[A-Za-z0-9_]+)\s*$')
+# True for a non-empty ASCII [A-Za-z0-9_] run
+def is_c_ident(s: str) -> bool:
+    return s.isascii() and s.replace("_", "").isalnum()
+
+# Match lines of the form "#define glFoo glad_glFoo" (any spacing) and return "glFoo";
+# plain string tests instead of a regex, since this runs on every header line
+def match_define(line: str) -> Optional[str]:
+    s = line.lstrip()
+    if not s.startswith("#"):
+        return None
+    s = s[1:].lstrip()
+    if not s.startswith("define") or not s[6:7].isspace():
+        return None
+    parts = s[6:].split()
+    if len(parts) != 2:
+        return None
+    name, target = parts
+    if len(name) > 2 and name.startswith("gl") and len(target) > 7 and target.startswith("glad_gl") \
+            and is_c_ident(name) and is_c_ident(target):
+        return name
+    return None
+
+# Bounds for the backward docblock scan: generated docs sit right above their define and are short
+DOCBLOCK_MAX_GAP = 2       # blank lines tolerated between the closing "*/" and the define
+DOCBLOCK_MAX_LINES = 200   # lines searched upward for the opening "/**"
 
 # If a Doxygen block sits directly above a #define, return its (start, end) indices
 def find_docblock_above(lines: List[str], idx_define: int) -> Optional[Tuple[int,int]]:
+    # Skip a few trailing blank lines; the next line up must close a comment
     j = idx_define - 1
-    while j >= 0 and lines[j].strip() == "":
+    lowest = idx_define - 1 - DOCBLOCK_MAX_GAP
+    while j >= 0 and j > lowest and not lines[j].strip():
         j -= 1
-    if j < 0:
+    if j < 0 or "*/" not in lines[j]:
         return None
-    # Single-line /** ... */
-    if "*/" not in lines[j]:
-        if lines[j].lstrip().startswith("/**") and "*/" in lines[j]:
-            return (j, j)
-        return None
-    # Multi-line /** ... */: walk upward to find the start
+    # Walk upward through comment/blank lines to the opening "/**"
     end = j
     k = j
-    while k >= 0:
-        if "/**" in lines[k]:
+    stop = max(j - DOCBLOCK_MAX_LINES, -1)
+    while k > stop:
+        line = lines[k]
+        if "/**" in line:
             return (k, end)
-        if lines[k].strip() == "":
-            k -= 1
-            continue
-        if "*/" in lines[k] or lines[k].lstrip().startswith("*") or lines[k].lstrip().startswith("/*"):
-            k -= 1
-            continue
-        break
+        stripped = line.lstrip()
+        if stripped and "*/" not in line and not stripped.startswith(("*", "/*")):
+            break
+        k -= 1
     return None
 
 # Create a Doxygen block for a GL function name
-def build_doc(gl_name: str, reg: GLRegistry, refs: RefPages) -> Optional[str]:
+def build_doc(gl_name: str, reg: GLRegistry, refs: RefPages, base_url: str) -> Optional[str]:
     canon = reg.resolve_alias(gl_name)
 
     # Prefer exact refpage; fall back to canonical alias
@@ -357,18 +596,18 @@ def build_doc(gl_name: str, reg: GLRegistry, refs: RefPages) -> Optional[str]:
 
     # Parameter metadata from gl.xml
     reg_sig = reg.signature_canonical(gl_name)
-    reg_params_by_name: Dict[str, Dict[str, Optional[str]]] = {}
+    reg_params_by_name: Dict[str, GLParam] = {}
     if reg_sig:
         _ret_r, _params_r, _canon_r = reg_sig
         for rp in _params_r:
-            reg_params_by_name[rp["name"]] = rp
+            reg_params_by_name[rp.name] = rp
 
     # Choose a signature source
     if sig is None and reg_sig is None:
         return None
     if sig is None and reg_sig is not None:
         ret = reg_sig[0]
-        params_list = [(p["type"], p["name"]) for p in reg_sig[1]]
+        params_list = [(p.type, p.name) for p in reg_sig[1]]
     else:
         ret, params_list = sig  # type: ignore
 
@@ -376,10 +615,7 @@ def build_doc(gl_name: str, reg: GLRegistry, refs: RefPages) -> Optional[str]:
     lines: List[str] = []
     lines.append("/**")
     if brief:
-        if not brief.endswith("."):
-            lines.append(f" * \\brief {brief}.")
-        else:
-            lines.append(f" * \\brief {brief}")
+        lines.append(_FMT_BRIEF % (brief if brief.endswith(".") else brief + "."))
 
     seen_p: Set[str] = set()
     for ptype, pname in params_list:
@@ -390,59 +626,136 @@ def build_doc(gl_name: str, reg: GLRegistry, refs: RefPages) -> Optional[str]:
         lines.append(make_param_line_with_desc(pname, ptype, pdesc.get(pname), trailer))
 
     if ret and ret.strip() != "void":
-        lines.append(f" * \\return ({ret})")
+        lines.append(_FMT_RETURN % ret)
 
-    lines.append(f" * \\see {make_refpage_url(refs.folder_tag, gl_name)}")
+    lines.append(_FMT_SEE % (base_url, gl_name))
 
     version, exts = reg.version_or_exts(gl_name)
     note_parts: List[str] = []
     if version:
-        note_parts.append(f"Introduced in OpenGL {version}")
+        note_parts.append(_FMT_NOTE_VERSION % version)
     if exts:
-        note_parts.append("Introduced by extension(s): " + ", ".join(exts))
+        note_parts.append(_FMT_NOTE_EXTS % ", ".join(exts))
     if note_parts:
-        lines.append(" * \\note " + " | ".join(note_parts))
+        lines.append(_FMT_NOTE % " | ".join(note_parts))
 
     lines.append(" */")
     return "\n".join(lines)
 
-# Read input header, inject/refresh docblocks above matching #defines, and write output
-def process(in_path: str, out_path: str, reg: GLRegistry, refs: RefPages) -> None:
-    with open(in_path, "r", encoding="utf-8", newline="") as f:
-        src_lines = f.read().splitlines()
-
-    # Identify ranges of existing docblocks immediately above matching defines
-    skip: Set[int] = set()
-    for i, line in enumerate(src_lines):
-        if DEFINE_RE.match(line):
-            rng = find_docblock_above(src_lines, i)
-            if rng:
-                a, b = rng
-                for t in range(a, b + 1):
-                    skip.add(t)
-
-    out_lines: List[str] = []
-    i = 0
-    n = len(src_lines)
-    while i < n:
-        if i in skip:
-            i += 1
-            continue
-        line = src_lines[i]
-        m = DEFINE_RE.match(line)
-        if m:
-            gl_name = m.group(1)
-            doc = build_doc(gl_name, reg, refs)
+# Find "#define glFoo glad_glFoo" lines in raw header bytes as (line start, line end, gl name).
+# Only lines containing "define" are decoded; line end excludes the "\n"
+def scan_defines(data: Union[bytes, mmap.mmap]) -> List[Tuple[int, int, str]]:
+    hits: List[Tuple[int, int, str]] = []
+    pos = 0
+    while True:
+        at = data.find(b"define", pos)
+        if at < 0:
+            return hits
+        start = data.rfind(b"\n", 0, at) + 1
+        end = data.find(b"\n", at)
+        if end < 0:
+            end = len(data)
+        gl_name = match_define(data[start:end].decode("utf-8"))
+        if gl_name:
+            hits.append((start, end, gl_name))
+        pos = end + 1
+
+# Raise UnicodeDecodeError unless the whole header is valid UTF-8, as the full-text read used to.
+# Checked in slices so a memory-mapped header is never copied whole; after this every later
+# decode of a piece of it is known to succeed, wherever the piece sits
+def check_utf8(data: Union[bytes, mmap.mmap], step: int = 1 << 20) -> None:
+    dec = codecs.getincrementaldecoder("utf-8")()
+    for i in range(0, len(data), step):
+        dec.decode(data[i:i + step])
+    dec.decode(b"", final=True)
+
+# Copy whole header lines through as bytes, with "\n" line endings
+def write_lines(out: BinaryIO, chunk: bytes) -> None:
+    out.write(chunk.replace(b"\r\n", b"\n") if b"\r" in chunk else chunk)
+
+# Write the header lines leading up to a define, minus a docblock sitting directly above it.
+# Only a chunk whose last non-blank line closes a comment is decoded and split, on "\n" alone
+# like write_lines, so \f and other separators survive either way
+def write_before_define(out: BinaryIO, chunk: bytes) -> None:
+    body = chunk.rstrip()
+    if b"*/" not in body[body.rfind(b"\n") + 1:]:
+        write_lines(out, chunk)
+        return
+    text = chunk.replace(b"\r\n", b"\n") if b"\r" in chunk else chunk
+    lines = text[:-1].decode("utf-8").split("\n")  # chunk ends at a line start, so on "\n"
+    rng = find_docblock_above(lines, len(lines))
+    if rng:
+        a, b = rng
+        del lines[a:b + 1]
+    if lines:
+        out.write(("\n".join(lines) + "\n").encode("utf-8"))
+
+# Binary handle for out_path that writes to a temporary file in the same directory and moves it
+# into place only when the block completes, so a failed run never leaves a truncated output
+# (which, for --in X --out X, would be the input)
+@contextmanager
+def replace_on_success(out_path: str) -> Iterator[BinaryIO]:
+    fd, tmp_path = tempfile.mkstemp(prefix=".glad_doxygen.", suffix=".tmp",
+                                    dir=os.path.dirname(os.path.abspath(out_path)))
+    try:
+        with os.fdopen(fd, "wb", buffering=1 << 20) as out:
+            yield out
+        # mkstemp creates the file 0600; give it the mode open(out_path, "w") would have left
+        try:
+            mode = stat.S_IMODE(os.stat(out_path).st_mode)
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+# Inject/refresh docblocks above the matching #defines of a header held in memory (bytes or a
+# read-only mmap of the file), and write output
+def rewrite_header(data: Union[bytes, mmap.mmap], out_path: str, reg: GLRegistry, refs: RefPages, jobs: Optional[int] = None) -> None:
+    check_utf8(data)
+    defines = scan_defines(data)
+
+    # Parse the refpages of every define (and its canonical alias) up front, in parallel
+    names = [gl_name for _, _, gl_name in defines]
+    refs.prefetch(names + [reg.resolve_alias(n) for n in names], jobs)
+
+    # Copy the byte ranges between defines through, emitting a fresh docblock before each define
+    base_url = make_refpage_base_url(refs.folder_tag)
+    with replace_on_success(out_path) as out:
+        prev = 0
+        for start, end, gl_name in defines:
+            write_before_define(out, data[prev:start])
+            doc = build_doc(gl_name, reg, refs, base_url)
             if doc:
-                out_lines.append(doc)
-            out_lines.append(line)
-            i += 1
-            continue
-        out_lines.append(line)
-        i += 1
-
-    with open(out_path, "w", encoding="utf-8", newline="\n") as f:
-        f.write("\n".join(out_lines) + "\n")
+                out.write(doc.encode("utf-8"))
+                out.write(b"\n")
+            line = data[start:end]
+            out.write(line[:-1] if line.endswith(b"\r") else line)
+            out.write(b"\n")
+            prev = end + 1
+        rest = data[prev:]
+        if rest:
+            write_lines(out, rest if rest.endswith(b"\n") else rest + b"\n")
+
+# Read input header (memory-mapped), inject/refresh docblocks above matching #defines, and write output
+def process(in_path: str, out_path: str, reg: GLRegistry, refs: RefPages, jobs: Optional[int] = None) -> None:
+    with open(in_path, "rb") as f:
+        # Read outright when rewriting in place (the input must be closed before the output replaces it,
+        # e.g. on Windows) or when the file is empty (mmap cannot map it)
+        if (os.path.exists(out_path) and os.path.samefile(in_path, out_path)) or os.fstat(f.fileno()).st_size == 0:
+            data = f.read()
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                rewrite_header(mm, out_path, reg, refs, jobs)
+            return
+    rewrite_header(data, out_path, reg, refs, jobs)
 
 # CLI entry point
 def main() -> None:
@@ -454,11 +767,13 @@ def main() -> None:
     ap.add_argument("--xml", dest="xml_path", required=True)
     ap.add_argument("--out", dest="out_path", required=True)
     ap.add_argument("--refpages", dest="refpages", required=True)
+    ap.add_argument("--jobs", dest="jobs", type=int, default=None,
+                    help="worker processes for refpage parsing (default: CPU count; 1 disables)")
     args = ap.parse_args()
 
     reg = GLRegistry(args.xml_path)
     refs = RefPages(args.refpages)
-    process(args.in_path, args.out_path, reg, refs)
+    process(args.in_path, args.out_path, reg, refs, args.jobs)
 
 if __name__ == "__main__":
     main()